@@ -1,43 +1,131 @@
 """
 Help text for Conductor CLI
+
+The long help strings are built on first access through a module-level
+``__getattr__`` (PEP 562) and then cached as regular module globals, so
+importing this module on the non-help paths costs next to nothing.
 """
 
-DESCRIPTION = """Conductor - Jira Ticket Branch Creator
+SETUP_HELP = "Run setup to configure Jira credentials and settings"
+BRANCH_HELP = "Create a git branch from a Jira ticket"
+UPDATE_HELP = "Check for updates and install the latest version"
+DELETE_HELP = "Remove all Conductor files and directories from your system"
+VERSION_HELP = "Show the installed version and exit"
 
-A developer workflow tool that integrates Jira tickets with Git branch creation."""
+# Arguments registered on the parser in conductor.py, in help order, as
+# (flags, help). argparse adds -h/--help itself. USAGE and OPTIONS are
+# generated from this table, so the --help fast path prints what the parser
+# would (tests/test_cli_help.py checks this).
+ARGUMENTS = (
+    (("--version",), VERSION_HELP),
+    (("--setup",), SETUP_HELP),
+    (("-b", "--branch"), BRANCH_HELP),
+    (("--update",), UPDATE_HELP),
+    (("--delete-app",), DELETE_HELP),
+)
 
-EPILOG = """
-Examples:
-  conductor --setup       Run initial setup or reconfigure Jira credentials
-  conductor -b            Create a branch from a Jira ticket
-  conductor --branch      Create a branch from a Jira ticket
-  conductor --update      Check for updates and install the latest version
-  conductor -h            Show this help message
-  conductor --help        Show this help message
+USAGE = "usage: conductor [-h] " + " ".join(f"[{flags[0]}]" for flags, _ in ARGUMENTS)
 
-Description:
-  Conductor helps developers quickly create Git branches based on their
-  assigned Jira tickets. It fetches your tickets from the current sprint,
-  lets you select one, and automatically creates a properly formatted
-  branch name.
 
-Getting Started:
-  1. Run 'conductor --setup' to configure your Jira credentials
-  2. Navigate to any git repository
-  3. Run 'conductor -b' to create a branch from your Jira tickets
+def _build_description():
+    return "".join(
+        [
+            "Conductor - Jira Ticket Branch Creator\n",
+            "\n",
+            "A developer workflow tool that integrates Jira tickets with Git branch creation.",
+        ]
+    )
 
-Maintenance:
-  - Check for updates:  conductor --update
-  - Reconfigure:        conductor --setup
 
-Configuration:
-  After setup, you can manually edit the configuration files:
-    - config.json   : Jira settings, projects, statuses, branch patterns
-    - .env          : API token (keep this secure)
+def _build_epilog():
+    return "".join(
+        [
+            "\n",
+            "Examples:\n",
+            "  conductor --setup       Run initial setup or reconfigure Jira credentials\n",
+            "  conductor -b            Create a branch from a Jira ticket\n",
+            "  conductor --branch      Create a branch from a Jira ticket\n",
+            "  conductor --update      Check for updates and install the latest version\n",
+            "  conductor --version     Show the installed version\n",
+            "  conductor -h            Show this help message\n",
+            "  conductor --help        Show this help message\n",
+            "\n",
+            "Description:\n",
+            "  Conductor helps developers quickly create Git branches based on their\n",
+            "  assigned Jira tickets. It fetches your tickets from the current sprint,\n",
+            "  lets you select one, and automatically creates a properly formatted\n",
+            "  branch name.\n",
+            "\n",
+            "Getting Started:\n",
+            "  1. Run 'conductor --setup' to configure your Jira credentials\n",
+            "  2. Navigate to any git repository\n",
+            "  3. Run 'conductor -b' to create a branch from your Jira tickets\n",
+            "\n",
+            "Maintenance:\n",
+            "  - Check for updates:  conductor --update\n",
+            "  - Reconfigure:        conductor --setup\n",
+            "\n",
+            "Configuration:\n",
+            "  After setup, you can manually edit the configuration files:\n",
+            "    - config.json   : Jira settings, projects, statuses, branch patterns\n",
+            "    - .env          : API token (keep this secure)\n",
+            "\n",
+            "  Configuration location: ~/.conductor/\n",
+        ]
+    )
 
-  Configuration location: ~/.conductor/
-"""
 
-SETUP_HELP = "Run setup to configure Jira credentials and settings"
-BRANCH_HELP = "Create a git branch from a Jira ticket"
-UPDATE_HELP = "Check for updates and install the latest version"
+def _build_options():
+    # Laid out like argparse: invocations padded to the longest one, with the
+    # help text two spaces after it
+    rows = [("-h, --help", "show this help message and exit")]
+    rows += [(", ".join(flags), help_text) for flags, help_text in ARGUMENTS]
+    width = max(len(invocation) for invocation, _ in rows)
+    return "\n".join(
+        ["options:"]
+        + [f"  {invocation:<{width}}  {help_text}" for invocation, help_text in rows]
+    )
+
+
+def _build_help():
+    return "".join(
+        [
+            USAGE,
+            "\n\n",
+            _lookup("DESCRIPTION"),
+            "\n\n",
+            _lookup("OPTIONS"),
+            "\n",
+            _lookup("EPILOG"),
+        ]
+    )
+
+
+_LAZY_BUILDERS = {
+    "DESCRIPTION": _build_description,
+    "EPILOG": _build_epilog,
+    "OPTIONS": _build_options,
+    "HELP": _build_help,
+}
+
+
+def __getattr__(name: str) -> str:
+    """Build a long help string on first access and cache it."""
+    try:
+        builder = _LAZY_BUILDERS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = builder()
+    globals()[name] = value
+    return value
+
+
+def _lookup(name: str) -> str:
+    """Return a help string, reusing the cached value when already built."""
+    value = globals().get(name)
+    return value if value is not None else __getattr__(name)
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_BUILDERS))
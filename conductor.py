@@ -6,27 +6,41 @@ Usage:
   conductor --setup    Configure Jira credentials and settings
   conductor -b         Create a git branch from a Jira ticket
   conductor -h         Show help
+  conductor --version  Show version
 """
 
-import argparse
 import sys
-import importlib
+from importlib.util import find_spec
+
+# Flags that only print information and never touch Jira or git
+READ_ONLY_FLAGS = {"-h", "--help", "--version"}
+
+# Action flags and the parsed-argument name they set
+FLAG_ACTIONS = {
+    "--setup": "setup",
+    "-b": "branch",
+    "--branch": "branch",
+    "--update": "update",
+    "--delete-app": "delete_app",
+}
+
+
+def needs_dependencies(argv):
+    """Return True unless the invocation is a read-only one (help/version)."""
+    return bool(argv) and not set(argv) <= READ_ONLY_FLAGS
 
 
 def check_dependencies():
-    """Check if required dependencies are installed."""
+    """Check if required dependencies are installed (without importing them)."""
     required_packages = {
         "jira": "jira",
         "questionary": "questionary",
         "git": "GitPython",
-        "dotenv": "python-dotenv",
         "requests": "requests",
     }
     missing_packages = []
     for import_name, package_name in required_packages.items():
-        try:
-            importlib.import_module(import_name)
-        except ImportError:
+        if find_spec(import_name) is None:
             missing_packages.append(package_name)
 
     if missing_packages:
@@ -38,12 +52,30 @@ def check_dependencies():
         sys.exit(1)
 
 
+def run_action(action):
+    """Run the sub-command for an action flag and exit."""
+    if action == "delete_app":
+        from conductor_delete import main as delete_main
+        delete_main()
+    elif action == "update":
+        from conductor_update import main as update_main
+        update_main()
+    elif action == "setup":
+        from conductor_setup import main as setup_main
+        setup_main()
+    elif action == "branch":
+        from jira_branch_creator import main as branch_creator_main
+        branch_creator_main()
+    sys.exit(0)
 
-def main():
-    """Main entry point for conductor CLI."""
-    check_dependencies()
 
-    from cli_help import DESCRIPTION, EPILOG, SETUP_HELP, BRANCH_HELP
+def build_parser():
+    """Build the argument parser from the argument table in cli_help."""
+    import argparse
+
+    from cli_help import ARGUMENTS, DESCRIPTION, EPILOG
+    from version import __version__
+
     parser = argparse.ArgumentParser(
         prog='conductor',
         description=DESCRIPTION,
@@ -51,56 +83,53 @@ def main():
         epilog=EPILOG
     )
 
-    parser.add_argument(
-        '--setup',
-        action='store_true',
-        help=SETUP_HELP
-    )
+    for flags, help_text in ARGUMENTS:
+        if flags == ('--version',):
+            parser.add_argument(
+                *flags,
+                action='version',
+                version=f'%(prog)s {__version__}',
+                help=help_text
+            )
+        else:
+            parser.add_argument(*flags, action='store_true', help=help_text)
 
-    parser.add_argument(
-        '-b', '--branch',
-        action='store_true',
-        help=BRANCH_HELP
-    )
+    return parser
 
-    parser.add_argument(
-        '--update',
-        action='store_true',
-        help='Check for updates and install the latest version'
-    )
 
-    parser.add_argument(
-        '--delete-app',
-        action='store_true',
-        help='Remove all Conductor files and directories from your system'
-    )
+def main():
+    """Main entry point for conductor CLI."""
+    argv = sys.argv[1:]
 
-    args = parser.parse_args()
+    # Fast path: answer help/version without building the parser
+    if not argv or argv in (["-h"], ["--help"]):
+        from cli_help import HELP
 
-    # Handle --delete-app flag
-    if args.delete_app:
-        from conductor_delete import main as delete_main
-        delete_main()
+        # HELP already ends with a newline, like parser.format_help()
+        print(HELP, end="")
         sys.exit(0)
 
+    if argv == ["--version"]:
+        from version import __version__
 
-    # Handle --update flag
-    if args.update:
-        from conductor_update import main as update_main
-        update_main()
+        print(f"conductor {__version__}")
         sys.exit(0)
 
-    # Handle --setup flag
-    if args.setup:
-        from conductor_setup import main as setup_main
-        setup_main()
-        sys.exit(0)
+    if needs_dependencies(argv):
+        check_dependencies()
 
-    # Handle -b/--branch flag (create branch)
-    if args.branch:
-        from jira_branch_creator import main as branch_creator_main
-        branch_creator_main()
-        sys.exit(0)
+    # Fast path: a single action flag is dispatched without argparse or
+    # cli_help; anything else (combinations, typos) goes through the parser
+    if len(argv) == 1 and argv[0] in FLAG_ACTIONS:
+        run_action(FLAG_ACTIONS[argv[0]])
+
+    parser = build_parser()
+    args = parser.parse_args()
+
+    # Handle flags in priority order: --delete-app, --update, --setup, -b/--branch
+    for action in ("delete_app", "update", "setup", "branch"):
+        if getattr(args, action):
+            run_action(action)
 
     # If no flags provided, show help
     parser.print_help()
@@ -5,13 +5,38 @@ Conductor Uninstaller
 Removes all Conductor files and directories from the system.
 """
 
-import shutil
+import os
 import sys
-from pathlib import Path
 
 import questionary
 
-from settings import CONDUCTOR_HOME
+from settings import BIN_DIR, CONDUCTOR_HOME
+
+# Command wrappers created by install.sh
+COMMAND_PATHS = [
+    BIN_DIR / command for command in ("conductor", "conductor-setup", "conductor-update")
+]
+
+
+def remove_tree(path):
+    """Recursively delete a directory.
+
+    Uses os.scandir so each entry's type comes from the directory listing
+    instead of an extra stat call. Symlinks are removed, never followed,
+    including ``path`` itself: a symlinked root is unlinked and its target
+    left alone.
+    """
+    if os.path.islink(path):
+        os.unlink(path)
+        return
+
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                remove_tree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
 
 
 def main():
@@ -45,23 +70,19 @@ def main():
         # 1. Remove the installation directory
         if CONDUCTOR_HOME.exists():
             print(f"Removing {CONDUCTOR_HOME}...")
-            shutil.rmtree(CONDUCTOR_HOME)
+            remove_tree(CONDUCTOR_HOME)
             print("✅ Installation directory removed.")
         else:
             print("✅ Installation directory already removed.")
 
         # 2. Remove the command shortcuts
-        bin_dir = Path.home() / ".local" / "bin"
-        commands_to_remove = ["conductor", "conductor-setup", "conductor-update"]
-
-        for command in commands_to_remove:
-            command_path = bin_dir / command
-            if command_path.exists():
-                print(f"Removing {command_path}...")
+        for command_path in COMMAND_PATHS:
+            try:
                 command_path.unlink()
-                print(f"✅ {command} command removed.")
+            except FileNotFoundError:
+                print(f"✅ {command_path.name} command already removed.")
             else:
-                print(f"✅ {command} command already removed.")
+                print(f"✅ {command_path.name} command removed.")
 
         print("\n✅ Conductor has been successfully uninstalled.")
 
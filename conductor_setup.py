@@ -3,51 +3,45 @@
 Conductor Setup
 
 Interactive setup that configures Jira credentials and fetches project/status options.
-Writes data incrementally to avoid losing progress on failures.
+Credentials are saved before the connection test so they survive a failed run;
+the remaining settings are written together at the end.
 """
 
-import json
 import os
 import sys
+import threading
+from concurrent.futures import Future
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
 
 import questionary
-from jira import JIRA
 
-from settings import CONDUCTOR_HOME
+import json_compat
+from settings import CONDUCTOR_HOME, CONFIG_PATH, ENV_PATH, read_env_value
+
+# The Jira client (and requests) is imported where it's created; it's only
+# needed once credentials have been entered
+if TYPE_CHECKING:
+    from jira_rest import JiraClient
 
 # Configuration - Use user's home directory
-CONFIG_PATH = CONDUCTOR_HOME / "config.json"
 CONFIG_EXAMPLE = CONDUCTOR_HOME / "config.example.json"
-ENV_PATH = CONDUCTOR_HOME / ".env"
 
 
 def check_dependencies():
-    """Check if required packages are installed."""
+    """Check if required packages are installed (without importing them)."""
+    required_packages = {
+        "questionary": "questionary",
+        "jira": "jira",
+        "git": "GitPython",
+    }
     missing = []
 
-    try:
-        import questionary
-
-        if questionary:
-            print("questionary found")
-    except ImportError:
-        missing.append("questionary")
-
-    try:
-        import jira
-
-        if jira:
-            print("jira")
-    except ImportError:
-        missing.append("jira")
-
-    try:
-        import git
-
-        if git:
-            print("GitPython found")
-    except ImportError:
-        missing.append("GitPython")
+    for import_name, package_name in required_packages.items():
+        if find_spec(import_name) is None:
+            missing.append(package_name)
+        else:
+            print(f"{package_name} found")
 
     if missing:
         print("Error: Missing required packages:")
@@ -61,30 +55,28 @@ def check_dependencies():
 def load_existing_config():
     """Load existing config if available."""
     config = {}
-    if CONFIG_PATH.exists():
-        try:
-            with open(CONFIG_PATH, "r") as f:
-                config = json.load(f)
-            print(f"Found existing config: {CONFIG_PATH}")
-        except json.JSONDecodeError:
-            print("Warning: Could not read existing config, starting fresh")
+    try:
+        with open(CONFIG_PATH, "rb") as f:
+            config = json_compat.loads(f.read())
+        print(f"Found existing config: {CONFIG_PATH}")
+    except FileNotFoundError:
+        pass
+    except ValueError:
+        print("Warning: Could not read existing config, starting fresh")
     return config
 
 
 def load_existing_env():
     """Load existing .env if available."""
     api_token = None
-    if ENV_PATH.exists():
-        try:
-            with open(ENV_PATH, "r") as f:
-                for line in f:
-                    if line.startswith("JIRA_API_TOKEN="):
-                        api_token = line.strip().split("=", 1)[1]
-                        break
-            if api_token:
-                print(f"Found existing API token: {ENV_PATH}")
-        except Exception as e:
-            print(f"Warning: Could not read existing .env: {e}")
+    try:
+        api_token = read_env_value(ENV_PATH, "JIRA_API_TOKEN")
+        if api_token:
+            print(f"Found existing API token: {ENV_PATH}")
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Warning: Could not read existing .env: {e}")
     return api_token
 
 
@@ -161,14 +153,16 @@ def prompt_for_credentials(existing_config=None, existing_token=None):
 
 
 def test_jira_connection(server: str, username: str, api_token: str):
-    """Test Jira connection and return JIRA client."""
+    """Test Jira connection and return the Jira client."""
+    from jira_rest import JiraClient
+
     if "@" not in username:
         print(f"ERROR: Username '{username}' must be a full email address!")
         print("Example: juan.feris@invitationhomes.com")
         sys.exit(1)
 
     try:
-        jira = JIRA(server=server, basic_auth=(username, api_token))
+        jira = JiraClient(server, basic_auth=(username, api_token))
         jira.myself()  # Test connection
         print("✅ Successfully connected to Jira")
         return jira
@@ -187,37 +181,57 @@ def test_jira_connection(server: str, username: str, api_token: str):
         sys.exit(1)
 
 
-def fetch_projects(jira: JIRA):
-    """Fetch available Jira projects."""
-    try:
-        projects = jira.projects()
-        if not projects:
-            print("No projects found or insufficient permissions.")
-            return []
-
-        projects_sorted = sorted(projects, key=lambda p: p.key)
-        print(f"Found {len(projects_sorted)} project(s)")
-        return projects_sorted
-    except Exception as e:
-        print(f"Error fetching projects: {e}")
-        return []
+def fetch_projects(jira: "JiraClient"):
+    """Fetch available Jira projects, sorted by key.
 
+    Runs on a worker thread, so it doesn't print; see collect_fetch_result.
+    """
+    return sorted(jira.projects(), key=lambda p: p.key)
 
-def fetch_statuses(jira: JIRA):
-    """Fetch available Jira statuses."""
+
+def fetch_statuses(jira: "JiraClient"):
+    """Fetch available Jira status names, sorted and de-duplicated.
+
+    Runs on a worker thread, so it doesn't print; see collect_fetch_result.
+    """
+    return sorted({status.name for status in jira.statuses()})
+
+
+def start_fetch(fetch, jira: "JiraClient") -> Future:
+    """Run ``fetch(jira)`` on a daemon thread and return its future.
+
+    A daemon thread (rather than an executor, whose workers are joined at
+    interpreter exit) lets setup exit right away when the user cancels a
+    prompt, even with a request still in flight.
+    """
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(fetch(jira))
+        except Exception as e:
+            future.set_exception(e)
+
+    thread_name = f"conductor-{fetch.__name__}"
+    threading.Thread(target=run, name=thread_name, daemon=True).start()
+    return future
+
+
+def collect_fetch_result(future, name, count_label):
+    """Wait for a background fetch and report its outcome."""
     try:
-        statuses = jira.statuses()
-        if not statuses:
-            print("No statuses found or insufficient permissions.")
-            return []
-
-        status_names = sorted(set(status.name for status in statuses))
-        print(f"Found {len(status_names)} status(es)")
-        return status_names
+        items = future.result()
     except Exception as e:
-        print(f"Error fetching statuses: {e}")
+        print(f"Error fetching {name}: {e}")
         return []
 
+    if not items:
+        print(f"No {name} found or insufficient permissions.")
+        return []
+
+    print(f"Found {len(items)} {count_label}")
+    return items
+
 
 def select_projects(projects, existing_projects=None):
     """Let user select one or more projects (optional)."""
@@ -306,18 +320,18 @@ def save_config_partial(config_data):
     """Save config data incrementally."""
     try:
         # Load existing config if any
-        if CONFIG_PATH.exists():
-            with open(CONFIG_PATH, "r") as f:
-                config = json.load(f)
-        else:
+        try:
+            with open(CONFIG_PATH, "rb") as f:
+                config = json_compat.loads(f.read())
+        except FileNotFoundError:
             config = {}
 
         # Update with new data
         config.update(config_data)
 
         # Save back to file
-        with open(CONFIG_PATH, "w") as f:
-            json.dump(config, f, indent=2)
+        with open(CONFIG_PATH, "wb") as f:
+            f.write(json_compat.dumps(config))
 
         print(f"💾 Saved to {CONFIG_PATH}")
         return True
@@ -373,31 +387,37 @@ def main():
     print("\n🔄 Testing connection...")
     jira = test_jira_connection(server, username, api_token)
 
-    # Fetch and select projects (optional)
+    # Remaining settings are collected here and written once at the end;
+    # only the credentials above are persisted before the network calls
+    pending_config = {}
+
+    # Fetch projects and statuses in the background (independent requests)
+    # while the user answers the questions that don't need them; each result
+    # is only waited for right before its selection prompt
+    projects_future = start_fetch(fetch_projects, jira)
+    statuses_future = start_fetch(fetch_statuses, jira)
+
+    # Ask about branch prefixes (doesn't need Jira)
+    use_branch_prefixes = ask_branch_prefixes(existing_config)
+    pending_config["use_branch_prefixes"] = use_branch_prefixes
+
+    # Select projects (optional)
     print("\n🔄 Fetching available projects...")
-    projects = fetch_projects(jira)
+    projects = collect_fetch_result(projects_future, "projects", "project(s)")
     existing_projects = existing_config.get("project_keys", [])
     selected_projects = select_projects(projects, existing_projects)
 
-    # Save projects immediately
     if selected_projects is not None:
-        print("\n💾 Saving projects...")
-        save_config_partial({"project_keys": selected_projects})
+        pending_config["project_keys"] = selected_projects
 
-    # Fetch and select statuses (optional)
+    # Select statuses (optional)
     print("\n🔄 Fetching available statuses...")
-    statuses = fetch_statuses(jira)
+    statuses = collect_fetch_result(statuses_future, "statuses", "status(es)")
     existing_statuses = existing_config.get("ticket_statuses", [])
     selected_statuses = select_statuses(statuses, existing_statuses)
 
-    # Save statuses immediately
     if selected_statuses is not None:
-        print("\n💾 Saving statuses...")
-        save_config_partial({"ticket_statuses": selected_statuses})
-
-    # Ask about branch prefixes (now in setup)
-    use_branch_prefixes = ask_branch_prefixes(existing_config)
-    save_config_partial({"use_branch_prefixes": use_branch_prefixes})
+        pending_config["ticket_statuses"] = selected_statuses
 
     # Set defaults for other fields if not present
     print("\n🔧 Finalizing configuration...")
@@ -417,13 +437,11 @@ def main():
     }
 
     # Only add defaults if they don't exist
-    config_to_save = {}
     for key, value in final_config.items():
         if key not in existing_config:
-            config_to_save[key] = value
+            pending_config[key] = value
 
-    if config_to_save:
-        save_config_partial(config_to_save)
+    save_config_partial(pending_config)
 
     # Summary
     print("\n" + "=" * 50)
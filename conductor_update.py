@@ -5,48 +5,41 @@ Conductor Updater
 Downloads and runs the latest version of the installer script.
 """
 
-import os
 import sys
 import subprocess
+from urllib.error import URLError
+from urllib.request import urlopen
 
 
 def main():
     """Main update function."""
     print("Updating Conductor...")
-    
+
     # URL of the raw installer script on GitHub
     installer_url = "https://raw.githubusercontent.com/ferisjuan/conductor/main/install.sh"
-    
-    # Path to temporarily store the installer
-    temp_installer_path = "/tmp/conductor_install.sh"
-    
+
     try:
-        # Download the latest installer
+        # Download the latest installer straight into memory
         print(f"Downloading latest installer from {installer_url}...")
-        subprocess.run(
-            ["curl", "-fsSL", installer_url, "-o", temp_installer_path],
-            check=True
-        )
-        
-        # Make the installer executable
-        os.chmod(temp_installer_path, 0o755)
-        
-        # Run the installer
+        with urlopen(installer_url, timeout=30) as response:
+            installer_script = response.read().decode("utf-8")
+
+        # Run the installer; passed with -c (not stdin) so its prompts can
+        # still read from the terminal
         print("Running installer...")
-        subprocess.run([temp_installer_path], check=True)
-        
+        subprocess.run(["bash", "-c", installer_script], check=True)
+
         print("\n✅ Conductor has been updated successfully!")
-        
+
+    except URLError as e:
+        print(f"❌ Could not download installer: {e}")
+        sys.exit(1)
     except subprocess.CalledProcessError as e:
         print(f"❌ Update failed: {e}")
         sys.exit(1)
     except Exception as e:
         print(f"❌ An unexpected error occurred: {e}")
         sys.exit(1)
-    finally:
-        # Clean up the temporary installer
-        if os.path.exists(temp_installer_path):
-            os.remove(temp_installer_path)
 
 
 if __name__ == "__main__":
@@ -146,6 +146,8 @@ install_via_script() {
   curl -fsSL "$RAW_URL/settings.py" -o "$INSTALL_DIR/settings.py"
   curl -fsSL "$RAW_URL/conductor_update.py" -o "$INSTALL_DIR/conductor_update.py"
   curl -fsSL "$RAW_URL/conductor_delete.py" -o "$INSTALL_DIR/conductor_delete.py"
+  curl -fsSL "$RAW_URL/json_compat.py" -o "$INSTALL_DIR/json_compat.py"
+  curl -fsSL "$RAW_URL/jira_rest.py" -o "$INSTALL_DIR/jira_rest.py"
 
   # Make scripts executable
   chmod +x "$INSTALL_DIR/conductor.py"
@@ -153,7 +155,7 @@ install_via_script() {
 
   # Install Python dependencies
   print_info "Installing dependencies..."
-  if ! "$VENV_DIR/bin/pip" install jira questionary gitpython python-dotenv requests; then
+  if ! "$VENV_DIR/bin/pip" install jira questionary gitpython requests; then
     print_error "Failed to install dependencies."
     return 1
   fi
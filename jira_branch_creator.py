@@ -6,45 +6,109 @@ Fetches Jira tickets and creates git branches based on user selection.
 Filters tickets to only show those in the current sprint.
 """
 
+import functools
 import json
 import os
 import re
 import sys
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
+
+import json_compat
+from settings import CONFIG_PATH, ENV_PATH, read_env_value
+
+
+# Heavy third-party modules (requests via jira_rest, GitPython, questionary)
+# are imported inside the functions that use them so that `conductor --help`
+# and friends don't pay their import cost.
+if TYPE_CHECKING:
+    import git
+    from jira_rest import Issue, JiraClient
+
+# Only the issue fields read by display_tickets/generate_branch_name and the
+# summary printed by main(); everything else is left off the search payload.
+TICKET_FIELDS = "summary,status,issuetype"
+
+# Tickets fetched per search request; more are loaded on demand
+PAGE_SIZE = 25
+
+# Returned by display_tickets when the user asks for more tickets
+LOAD_MORE = "load_more"
+
+# Non-ticket entries in the ticket picker
+LOAD_MORE_LABEL = "⬇️  Load more…"
+CANCEL_LABEL = "❌ Cancel"
+
+# Above this many tickets the picker switches from an arrow-key list to
+# type-to-filter autocomplete. Tied to the page size so a single page always
+# gets the list; only "Load more" past the first page switches
+AUTOCOMPLETE_THRESHOLD = PAGE_SIZE
+
+# Branch-name cleanup patterns, compiled once at import
+_DUP_HYPHEN = re.compile(r"-{2,}")
+# Any run of characters outside the safe set; see _sanitize_run
+_UNSAFE_RUN = re.compile(r"[^a-z0-9/]+")
+_SEPARATORS = frozenset(" _-")
+
+
+# Default issue type -> branch prefix mapping
+DEFAULT_BRANCH_PREFIXES = {
+    "Bug": "bugfix",
+    "Story": "feature",
+    "Task": "feature",
+    "Epic": "feature",
+    "Improvement": "improvement",
+    "Spike": "spike",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Settings read from config.json (only server and username are required)."""
+
+    jira_server: str
+    jira_username: str
+    project_keys: List[str] = field(default_factory=list)
+    ticket_statuses: List[str] = field(default_factory=list)
+    use_branch_prefixes: bool = True
+    max_results: int = 100
+    branch_prefixes: Dict[str, str] = field(
+        default_factory=lambda: dict(DEFAULT_BRANCH_PREFIXES)
+    )
+    branch_pattern: str = "{type}/{ticket_key}-{summary}"
+    ticket_code_case: str = "lower"
+    additional_jql: str = ""
+
 
-import git
-import git.exc
-import questionary
-from dotenv import load_dotenv
-from jira import JIRA, Issue
+_CONFIG_FIELDS = frozenset(f.name for f in fields(Config))
 
-from settings import CONDUCTOR_HOME
 
+@functools.lru_cache(maxsize=4)
+def load_config(config_path: Optional[Path] = None) -> Config:
+    """Load configuration from JSON file.
 
-def load_config(config_path: Optional[Path] = None) -> Dict:
-    """Load configuration from JSON file."""
+    The result is cached per path.
+    """
     if config_path is None:
         # Use default location in user's home directory
-        config_path = CONDUCTOR_HOME / "config.json"
+        config_path = CONFIG_PATH
     else:
         config_path = Path(config_path)
 
-    if not config_path.exists():
+    try:
+        data = json_compat.loads(config_path.read_bytes())
+    except FileNotFoundError:
         print(f"Error: {config_path} not found!")
         print("Please run 'conductor --setup' to configure Conductor.")
         sys.exit(1)
-
-    try:
-        with open(config_path) as f:
-            config = json.load(f)
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         print(f"Error: Invalid JSON in {config_path}: {e}")
         sys.exit(1)
 
     # Validate required fields (only server and username are now required)
     required_fields = ["jira_server", "jira_username"]
-    missing_fields = [field for field in required_fields if not config.get(field)]
+    missing_fields = [name for name in required_fields if not data.get(name)]
 
     if missing_fields:
         print(
@@ -53,134 +117,179 @@ def load_config(config_path: Optional[Path] = None) -> Dict:
         print("\nRun 'python setup.py' to configure Conductor.")
         sys.exit(1)
 
-    # Make optional fields optional
-    config.setdefault("project_keys", [])
-    config.setdefault("ticket_statuses", [])
-    config.setdefault("use_branch_prefixes", True)
-    config.setdefault("max_results", 100)  # Increased default
-    config.setdefault(
-        "branch_prefixes",
-        {
-            "Bug": "bugfix",
-            "Story": "feature",
-            "Task": "feature",
-            "Epic": "feature",
-            "Improvement": "improvement",
-            "Spike": "spike",
-        },
+    # Optional fields fall back to the Config defaults; unknown keys are ignored
+    return Config(
+        **{
+            key: value
+            for key, value in data.items()
+            if key in _CONFIG_FIELDS and value is not None
+        }
     )
 
-    return config
-
 
+@functools.lru_cache(maxsize=4)
 def load_env(env_path: Optional[Path] = None) -> Dict[str, str]:
-    """Load environment variables from .env file."""
-    if env_path is None:
-        # Use default location in user's home directory
-        env_path = CONDUCTOR_HOME / ".env"
-    else:
-        env_path = Path(env_path)
+    """Load the Jira API token from the .env file.
+
+    The result is cached per path; callers must treat it as read-only.
+    """
+    # An exported variable wins over the file, as it did with python-dotenv,
+    # and makes reading the file unnecessary
+    api_token = os.environ.get("JIRA_API_TOKEN")
+
+    if not api_token:
+        if env_path is None:
+            # Use default location in user's home directory
+            env_path = ENV_PATH
+        else:
+            env_path = Path(env_path)
 
-    if not env_path.exists():
-        print(f"Error: {env_path} not found!")
+        try:
+            api_token = read_env_value(env_path, "JIRA_API_TOKEN")
+        except FileNotFoundError:
+            print(f"Error: {env_path} not found!")
+            print("\nRun 'conductor --setup' to configure Conductor.")
+            sys.exit(1)
+
+    if not api_token:
+        print("Error: Missing environment variables: JIRA_API_TOKEN")
         print("\nRun 'conductor --setup' to configure Conductor.")
         sys.exit(1)
 
-    load_dotenv(dotenv_path=env_path)
-
-    required_vars = ["JIRA_API_TOKEN"]
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
+    return {"api_token": api_token}
 
-    if missing_vars:
-        print(f"Error: Missing environment variables: {', '.join(missing_vars)}")
-        print("\nRun 'python setup.py' to configure Conductor.")
-        sys.exit(1)
 
-    return {"api_token": os.getenv("JIRA_API_TOKEN") or ""}
+def connect_to_jira(config: Config, credentials: Dict[str, str]) -> "JiraClient":
+    """Establish connection to Jira instance."""
+    from jira_rest import JiraClient
 
+    # No separate connection probe: authentication problems surface on the
+    # first real request (see fetch_user_tickets)
+    jira = JiraClient(
+        config.jira_server,
+        basic_auth=(config.jira_username or "", credentials["api_token"]),
+    )
+    return jira
 
-def connect_to_jira(config: Dict, credentials: Dict[str, str]) -> JIRA:
-    """Establish connection to Jira instance."""
-    server = config.get("jira_server")
-    username = config.get("jira_username")
 
-    try:
-        jira = JIRA(
-            server=server, basic_auth=(username or "", credentials["api_token"])
-        )
-        jira.myself()  # Test connection
-        return jira
-    except Exception as e:
-        print(f"Error connecting to Jira: {e}")
-        sys.exit(1)
+def _jql_quote(value: str) -> str:
+    """Quote a value as a JQL string literal (escapes quotes and backslashes)."""
+    return json.dumps(value, ensure_ascii=False)
 
 
-def build_jql_query(config: Dict) -> str:
-    """Build JQL query for fetching tickets in current sprint."""
-    username = config.get("jira_username")
-    conditions = [f"assignee = '{username}'"]
+def _jql_conditions(config: Config):
+    """Yield the JQL conditions for the configured filters."""
+    yield f"assignee = {_jql_quote(config.jira_username)}"
 
     # Add sprint condition (current sprint)
-    conditions.append("sprint in openSprints()")
+    yield "sprint in openSprints()"
 
     # Optional project filter
-    if config.get("project_keys"):
-        projects = ", ".join([f'"{p}"' for p in config["project_keys"]])
-        conditions.append(f"project in ({projects})")
+    if config.project_keys:
+        yield f"project in ({', '.join(map(_jql_quote, config.project_keys))})"
 
     # Optional status filter
-    if config.get("ticket_statuses"):
-        statuses = ", ".join([f'"{s}"' for s in config["ticket_statuses"]])
-        conditions.append(f"status in ({statuses})")
+    if config.ticket_statuses:
+        yield f"status in ({', '.join(map(_jql_quote, config.ticket_statuses))})"
+
+    if config.additional_jql:
+        yield config.additional_jql
 
-    if config.get("additional_jql"):
-        conditions.append(config["additional_jql"])
 
-    return " AND ".join(conditions)
+def build_jql_query(config: Config) -> str:
+    """Build JQL query for fetching tickets in current sprint."""
+    return " AND ".join(_jql_conditions(config))
+
 
+def fetch_user_tickets(
+    jira: "JiraClient",
+    config: Config,
+    start_at: int = 0,
+    page_token: Optional[str] = None,
+) -> List["Issue"]:
+    """Fetch one page of tickets assigned to the user in current sprint.
 
-def fetch_user_tickets(jira: JIRA, config: Dict[str, str]) -> List[Issue]:
-    """Fetch tickets assigned to the user in current sprint."""
+    Jira Cloud pages with a ``nextPageToken`` (its /search/jql endpoint has
+    no startAt); Jira Server pages with ``startAt``. The returned list
+    carries whichever applies, see has_more_tickets.
+    """
     jql = build_jql_query(config)
-    print(f"\n🔍 Using JQL: {jql}")
+    if start_at == 0:
+        print(f"\n🔍 Using JQL: {jql}")
 
     max_results = None
 
     try:
-        max_results = int(config.get("max_results", 100))
+        max_results = int(config.max_results)
+        page_size = min(PAGE_SIZE, max_results - start_at)
+
+        print(f"📊 Fetching tickets {start_at + 1}-{start_at + page_size}...")
+        tickets = jira.search_issues(
+            jql,
+            fields=TICKET_FIELDS,
+            max_results=page_size,
+            start_at=start_at,
+            page_token=page_token,
+        )
 
-        # First, get total count
-        print(f"📊 Fetching tickets (max: {max_results})...")
-        tickets = jira.search_issues(jql, maxResults=max_results, startAt=0)
+        if start_at > 0:
+            return tickets
 
-        print(f"✅ Found {len(tickets)} ticket(s)")
+        # Cloud searches don't report a total, only whether another page exists
+        total = getattr(tickets, "total", len(tickets))
+        more_marker = "+" if getattr(tickets, "nextPageToken", None) else ""
+        print(f"✅ Found {total}{more_marker} ticket(s)")
 
         # Debug: Print first few ticket keys if found
         if tickets:
             print(f"🎫 Sample tickets: {', '.join([t.key for t in tickets[:5]])}")
-            if len(tickets) > 5:
-                print(f"   ... and {len(tickets) - 5} more")
+            if total > 5:
+                print(f"   ... and {total - 5}{more_marker} more")
 
-        if len(tickets) == max_results:
+        if total > max_results:
             print(
                 f"⚠️  Reached max results limit ({max_results}). Consider increasing 'max_results' in config.json"
             )
 
         return tickets
     except Exception as e:
+        # JiraError carries the HTTP status; treat auth failures as connection errors
+        if getattr(e, "status_code", None) in (401, 403):
+            print(f"Error connecting to Jira: {e}")
+            sys.exit(1)
+
         print(f"❌ Error fetching tickets: {e}")
         print("\n💡 Debug info:")
         print(f"   JQL: {jql}")
         print(f"   Max results: {max_results}")
+        print(f"   Start at: {start_at}")
         sys.exit(1)
 
 
+def has_more_tickets(last_page: List["Issue"], loaded: int, config: Config) -> bool:
+    """Check if another page can be fetched after loading ``loaded`` tickets."""
+    if loaded >= int(config.max_results):
+        return False
+    if getattr(last_page, "nextPageToken", None):
+        return True
+    return loaded < getattr(last_page, "total", loaded)
+
+
+def _sanitize_run(match: re.Match) -> str:
+    """Collapse a run of unsafe characters to one hyphen, or drop it.
+
+    Spaces, underscores and hyphens become a hyphen; anything else is
+    removed. Consecutive hyphens are merged, so a run containing at least
+    one separator yields a single "-" and any other run yields "".
+    """
+    return "-" if _SEPARATORS.intersection(match.group()) else ""
+
+
 def sanitize_branch_name(name: str, max_length: int = 60) -> str:
     """Sanitize string for use as git branch name."""
-    name = name.lower().replace(" ", "-").replace("_", "-")
-    name = re.sub(r"[^a-z0-9-/]", "", name)  # Keep only safe characters
-    name = re.sub(r"-+", "-", name)  # Remove consecutive hyphens
-    name = name.strip("-")
+    # Single pass: map separators to "-", drop unsafe characters and
+    # collapse consecutive hyphens
+    name = _UNSAFE_RUN.sub(_sanitize_run, name.lower()).strip("-")
 
     if len(name) > max_length:
         # Preserve ticket key if present
@@ -195,86 +304,96 @@ def sanitize_branch_name(name: str, max_length: int = 60) -> str:
     return name
 
 
-def generate_branch_name(ticket: Issue, config: Dict) -> str:
+def generate_branch_name(ticket: "Issue", config: Config) -> str:
     """Generate branch name based on ticket and config."""
-    # Get components
-    issue_type = ticket.fields.issuetype.name
-
-    # Branch type prefix
-    branch_prefixes = config.get("branch_prefixes", {})
-    branch_type = branch_prefixes.get(issue_type, "feature")
+    # Read each setting once up front
+    use_prefixes = config.use_branch_prefixes
+    case_setting = config.ticket_code_case
+    ticket_fields = ticket.fields
 
     # Ticket key - always keep project key uppercase, apply case to number part
     ticket_key = ticket.key
-    case_setting = config.get("ticket_code_case", "lower")
 
     # Split ticket key into project and number (e.g., "CDEM-1234" -> "CDEM", "1234")
     if "-" in ticket_key:
         project_key, ticket_number = ticket_key.split("-", 1)
         # Always keep project key uppercase
         project_key = project_key.upper()
-        # Apply case setting to the full key for display
+        # Apply case setting to the number part
         if case_setting == "lower":
-            ticket_key = f"{project_key}-{ticket_number}".lower()
-            # But preserve uppercase project in final key
-            ticket_key = f"{project_key}-{ticket_number.lower()}"
+            ticket_number = ticket_number.lower()
         elif case_setting == "upper":
-            ticket_key = f"{project_key}-{ticket_number}".upper()
-        else:
-            # Keep original case
-            ticket_key = f"{project_key}-{ticket_number}"
+            ticket_number = ticket_number.upper()
+        ticket_key = f"{project_key}-{ticket_number}"
 
     # Sanitized summary
-    summary = sanitize_branch_name(ticket.fields.summary)
-
-    # Check if prefixes are enabled
-    use_prefixes = config.get("use_branch_prefixes", True)
+    summary = sanitize_branch_name(ticket_fields.summary)
 
     if use_prefixes:
         # With prefixes: feature/CDEM-1234-something
-        # Get pattern from config
-        pattern = config.get("branch_pattern", "{type}/{ticket_key}-{summary}")
+        issue_type = ticket_fields.issuetype.name
+        branch_type = config.branch_prefixes.get(issue_type, "feature")
 
-        # Apply pattern
+        # Apply pattern from config
         try:
-            branch_name = pattern.format(
+            branch_name = config.branch_pattern.format(
                 type=branch_type, ticket_key=ticket_key, summary=summary
             )
-        except KeyError as e:
+        except (KeyError, IndexError) as e:
             print(f"Warning: Invalid placeholder {e} in branch pattern")
             # Fallback to simple format with prefix
             branch_name = f"{branch_type}/{ticket_key}-{summary}"
+
+        # The pattern and prefixes come from config and can introduce
+        # repeated hyphens; the summary itself is already collapsed
+        if "--" in branch_name:
+            branch_name = _DUP_HYPHEN.sub("-", branch_name)
     else:
-        # Without prefixes: CDEM-1234-something (just ticket key and summary)
+        # Without prefixes: CDEM-1234-something (just ticket key and summary).
+        # Both parts are hyphen-clean, so only an empty summary needs trimming
         branch_name = f"{ticket_key}-{summary}"
 
-    # Clean up the result
-    branch_name = re.sub(r"[-]+", "-", branch_name)  # Remove duplicate hyphens
-    branch_name = branch_name.strip("-")
-
-    return branch_name
+    return branch_name.strip("-")
 
 
-def get_git_repo() -> git.Repo:
+def get_git_repo() -> "git.Repo":
     """Get the current git repository."""
+    import git
+    import git.exc
+
     try:
-        return git.Repo(".")
+        # Also works from a subdirectory of the working tree
+        return git.Repo(".", search_parent_directories=True)
     except git.exc.InvalidGitRepositoryError:
         print("Error: Not in a git repository!")
         sys.exit(1)
 
 
-def check_working_directory_clean(repo: git.Repo) -> bool:
+def check_working_directory_clean(repo: "git.Repo") -> bool:
     """Check if working directory is clean."""
-    if repo.is_dirty():
+    # One `git status` instead of is_dirty()'s separate index and worktree
+    # diffs; untracked files don't count, same as is_dirty()'s default
+    if repo.git.status("--porcelain=v1", "--untracked-files=no"):
+        import questionary
+
         print("Warning: You have uncommitted changes.")
         return questionary.confirm("Proceed anyway?", default=False).ask()
     return True
 
 
-def handle_branch_creation(repo: git.Repo, branch_name: str):
+def handle_branch_creation(repo: "git.Repo", branch_name: str):
     """Create or checkout branch based on user preference."""
-    if branch_name in [b.name for b in repo.branches]:
+    import questionary
+    from git.exc import GitCommandError
+
+    # One `git rev-parse` on the ref instead of building a Head per branch
+    try:
+        repo.git.rev_parse("--verify", "--quiet", f"refs/heads/{branch_name}")
+        branch_exists = True
+    except GitCommandError:
+        branch_exists = False
+
+    if branch_exists:
         print(f"\nWarning: Branch '{branch_name}' already exists.")
         action = questionary.select(
             "What would you like to do?",
@@ -300,97 +419,138 @@ def handle_branch_creation(repo: git.Repo, branch_name: str):
             sys.exit(1)
 
 
+# Map of status keywords (lowercase) to icons
+_STATUS_ICONS = {
+    # In Progress / Working
+    "in progress": "🔨",
+    "working": "🔨",
+    "in development": "🔨",
+    "dev": "🔨",
+    # Ready for work
+    "ready for work": "📋",
+    "ready for dev": "📋",
+    "to do": "📋",
+    "todo": "📋",
+    "backlog": "📋",
+    # Review states
+    "peer review": "👀",
+    "code review": "👀",
+    "in review": "👀",
+    "review": "👀",
+    # QA / Testing
+    "ready for qa": "🧪",
+    "qa": "🧪",
+    "testing": "🧪",
+    "ready for test": "🧪",
+    "in qa": "🧪",
+    # UAT
+    "uat": "🎯",
+    "user acceptance": "🎯",
+    "ready for uat": "🎯",
+    "in uat": "🎯",
+    # Done / Completed
+    "done": "✅",
+    "completed": "✅",
+    "closed": "✅",
+    "resolved": "✅",
+    # Blocked / On Hold
+    "blocked": "🚫",
+    "on hold": "⏸️",
+    "waiting": "⏳",
+}
+
+# Partial matches are tried in the order above; the first keyword found in
+# the status decides its icon
+_STATUS_KEYWORDS = tuple(_STATUS_ICONS.items())
+
+
+def _scan_status_icon(status_lower: str) -> Optional[str]:
+    """Return the icon of the first keyword contained in the status."""
+    for keyword, icon in _STATUS_KEYWORDS:
+        if keyword in status_lower:
+            return icon
+    return None
+
+
+# Statuses named exactly like a keyword, resolved once so they skip the scan.
+# Resolved through the scan itself, so the result matches it ("ready for
+# dev" contains the earlier "dev").
+_STATUS_EXACT_ICONS = {keyword: _scan_status_icon(keyword) for keyword in _STATUS_ICONS}
+
+
 def get_status_icon(status_name: str) -> str:
     """Get emoji icon for ticket status."""
     status_lower = status_name.lower()
 
-    # Map of status keywords to icons
-    status_icons = {
-        # In Progress / Working
-        "in progress": "🔨",
-        "working": "🔨",
-        "in development": "🔨",
-        "dev": "🔨",
-        # Ready for work
-        "ready for work": "📋",
-        "ready for dev": "📋",
-        "to do": "📋",
-        "todo": "📋",
-        "backlog": "📋",
-        # Review states
-        "peer review": "👀",
-        "code review": "👀",
-        "in review": "👀",
-        "review": "👀",
-        # QA / Testing
-        "ready for qa": "🧪",
-        "qa": "🧪",
-        "testing": "🧪",
-        "ready for test": "🧪",
-        "in qa": "🧪",
-        # UAT
-        "uat": "🎯",
-        "user acceptance": "🎯",
-        "ready for uat": "🎯",
-        "in uat": "🎯",
-        # Done / Completed
-        "done": "✅",
-        "completed": "✅",
-        "closed": "✅",
-        "resolved": "✅",
-        # Blocked / On Hold
-        "blocked": "🚫",
-        "on hold": "⏸️",
-        "waiting": "⏳",
-    }
-
-    # Check for exact or partial matches
-    for keyword, icon in status_icons.items():
-        if keyword in status_lower:
-            return icon
+    # Exact match covers the common Jira status names
+    icon = _STATUS_EXACT_ICONS.get(status_lower)
+    if icon:
+        return icon
+
+    # Fall back to partial matches, defaulting for unknown statuses
+    return _scan_status_icon(status_lower) or "📌"
 
-    # Default icon for unknown statuses
-    return "📌"
 
+def display_tickets(
+    tickets: List["Issue"], has_more: bool = False
+) -> Union["Issue", str, None]:
+    """Display tickets and prompt user for selection.
 
-def display_tickets(tickets: List[Issue]) -> Optional[Issue]:
-    """Display tickets and prompt user for selection."""
+    Returns the selected ticket, LOAD_MORE if the user asked for the next
+    page, or None if cancelled.
+    """
     if not tickets:
         print("No tickets found.")
         return None
 
-    choices = []
+    import questionary
+
+    # Plain string labels (no per-ticket Choice objects); the label maps back
+    # to its ticket. Labels are unique because they start with the index.
+    tickets_by_label = {}
     for idx, ticket in enumerate(tickets, 1):
         # Get status info
         status_name = ticket.fields.status.name
         status_icon = get_status_icon(status_name)
 
         # Truncate summary if needed
-        summary = (
-            ticket.fields.summary[:50] + "..."
-            if len(ticket.fields.summary) > 53
-            else ticket.fields.summary
-        )
+        summary = ticket.fields.summary
+        if len(summary) > 53:
+            summary = summary[:50] + "..."
 
         # Format: Icon | Key | Summary | Status
-        choices.append(
-            questionary.Choice(
-                title=f"{idx:2d}. {status_icon} {ticket.key} - {summary} [{status_name}]",
-                value=ticket,
-            )
-        )
-
-    choices.append(questionary.Choice(title="❌ Cancel", value=None))
+        label = f"{idx:2d}. {status_icon} {ticket.key} - {summary} [{status_name}]"
+        tickets_by_label[label] = ticket
+
+    choices = list(tickets_by_label)
+    if has_more:
+        choices.append(LOAD_MORE_LABEL)
+    choices.append(CANCEL_LABEL)
+
+    if len(tickets) > AUTOCOMPLETE_THRESHOLD:
+        # Long lists: filter by typing part of the key or summary rather
+        # than redrawing the whole list on every arrow key
+        answer = questionary.autocomplete(
+            "Select a ticket to create a branch for (type to filter):",
+            choices=choices,
+            validate=lambda text: text in choices or "Pick an entry from the list",
+        ).ask()
+    else:
+        answer = questionary.select(
+            "Select a ticket to create a branch for:",
+            choices=choices,
+            instruction="Use arrow keys to navigate, Enter to select",
+        ).ask()
 
-    return questionary.select(
-        "Select a ticket to create a branch for:",
-        choices=choices,
-        instruction="Use arrow keys to navigate, Enter to select",
-    ).ask()
+    if answer == LOAD_MORE_LABEL:
+        return LOAD_MORE
+    return tickets_by_label.get(answer)
 
 
 def main():
     """Main execution function."""
+    import questionary
+
     print("Conductor - Jira Ticket Branch Creator")
     print("=" * 50)
 
@@ -398,21 +558,34 @@ def main():
     config = load_config()
     credentials = load_env()
 
-    # Connect to Jira
-    print("\nConnecting to Jira...")
+    # Create the Jira client; nothing is sent until the first search, which
+    # reports connection and authentication errors
     jira = connect_to_jira(config, credentials)
-    print("✅ Successfully connected to Jira")
 
     # Fetch tickets
-    print(f"\n🔄 Fetching tickets for {config['jira_username']} in current sprint...")
-    tickets = fetch_user_tickets(jira, config)
+    print(f"\n🔄 Fetching tickets for {config.jira_username} in current sprint...")
+    page = fetch_user_tickets(jira, config)
 
-    if not tickets:
+    if not page:
         print("\n❌ No tickets found matching the criteria.")
         sys.exit(0)
 
-    # Select ticket
-    selected_ticket = display_tickets(tickets)
+    # Select ticket, fetching further pages only when asked for
+    tickets = list(page)
+    while True:
+        selected_ticket = display_tickets(
+            tickets, has_more=has_more_tickets(page, len(tickets), config)
+        )
+        if selected_ticket is not LOAD_MORE:
+            break
+        page = fetch_user_tickets(
+            jira,
+            config,
+            start_at=len(tickets),
+            page_token=getattr(page, "nextPageToken", None),
+        )
+        tickets.extend(page)
+
     if not selected_ticket or not hasattr(selected_ticket, "fields"):
         print("\nOperation cancelled or invalid ticket selected.")
         sys.exit(0)
@@ -422,7 +595,7 @@ def main():
 
     # Confirm/Edit branch name
     prefix_status = (
-        "✅ enabled" if config.get("use_branch_prefixes", True) else "❌ disabled"
+        "✅ enabled" if config.use_branch_prefixes else "❌ disabled"
     )
     print(f"\nGenerated branch name: {branch_name}")
     print(f"Branch prefixes are {prefix_status} (change in config.json if needed)")
@@ -454,7 +627,7 @@ def main():
     print(f"   Branch: {confirmed_name}")
     print("=" * 50)
     print("\nYou can manually edit the configuration at any time:")
-    print(f"   {CONDUCTOR_HOME / 'config.json'}")
+    print(f"   {CONFIG_PATH}")
 
 
 if __name__ == "__main__":
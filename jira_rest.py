@@ -0,0 +1,240 @@
+"""
+Minimal Jira REST client for Conductor.
+
+Covers the few endpoints Conductor calls (myself, projects, statuses and
+issue search) on a plain requests.Session, so the jira package and its
+dependencies are not imported on the normal path. Results expose the same
+attributes as the jira package's resources (``issue.key``,
+``issue.fields.summary``, ``project.name``, ...).
+
+If a response doesn't have the expected shape, the call is retried through
+the full jira client, which is only imported at that point. Its results and
+errors are converted to this module's types, so callers see the same
+Resource/Issue/ResultList objects and JiraError either way.
+"""
+
+import threading
+from types import SimpleNamespace
+from typing import Any, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+API_PATH = "/rest/api/2"
+REQUEST_TIMEOUT = 30
+
+# Jira Cloud hosts page searches with nextPageToken (/search/jql) instead of
+# startAt (/search)
+CLOUD_HOST_SUFFIXES = (".atlassian.net", ".jira.com")
+
+
+class JiraError(Exception):
+    """A Jira request failed; ``status_code`` is set for HTTP errors."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class UnexpectedResponse(JiraError):
+    """Jira answered, but not with the JSON this client understands."""
+
+
+class Resource(SimpleNamespace):
+    """A Jira resource with attribute access to its JSON fields."""
+
+
+class Issue(Resource):
+    """An issue from a search: ``key`` plus its requested ``fields``."""
+
+
+class ResultList(list):
+    """One page of search results.
+
+    ``total`` is the match count where the server reports it (Jira Server),
+    otherwise the page length. ``nextPageToken`` is set when Jira Cloud has
+    another page; both names match the jira package's ResultList.
+    """
+
+    def __init__(
+        self, items: List[Issue], total: int, next_page_token: Optional[str] = None
+    ):
+        super().__init__(items)
+        self.total = total
+        self.nextPageToken = next_page_token
+
+
+def _to_resource(value: Any) -> Any:
+    """Convert decoded JSON into Resources, recursively."""
+    if isinstance(value, dict):
+        return Resource(**{key: _to_resource(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return [_to_resource(item) for item in value]
+    return value
+
+
+def _issue(raw: dict) -> Issue:
+    """Build an Issue from a search result's JSON."""
+    return Issue(key=raw["key"], fields=_to_resource(raw["fields"]))
+
+
+def _error_message(response: requests.Response) -> str:
+    """Summarize an error response, using Jira's error messages if present."""
+    try:
+        data = response.json()
+        messages = data.get("errorMessages") or list(data.get("errors", {}).values())
+    except (ValueError, AttributeError):
+        messages = []
+    detail = "; ".join(str(message) for message in messages) or response.reason
+    return f"HTTP {response.status_code}: {detail}"
+
+
+class JiraClient:
+    """Basic-auth Jira client.
+
+    requests.Session isn't thread-safe, so each thread using the client
+    (setup fetches projects and statuses in parallel) gets its own session,
+    and its own full jira client if it falls back to one.
+    """
+
+    def __init__(self, server: str, basic_auth: Tuple[str, str]):
+        self.server = server.rstrip("/")
+        self.basic_auth = basic_auth
+
+        hostname = urlparse(self.server).hostname or ""
+        self.is_cloud = hostname.endswith(CLOUD_HOST_SUFFIXES)
+
+        self._local = threading.local()
+
+    @property
+    def session(self) -> requests.Session:
+        """This thread's session, created on first use."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.auth = self.basic_auth
+            session.headers["Accept"] = "application/json"
+            self._local.session = session
+        return session
+
+    def _get(self, path: str, **params) -> Any:
+        """GET an API path and return the decoded JSON body."""
+        try:
+            response = self.session.get(
+                f"{self.server}{API_PATH}/{path}",
+                params=params,
+                timeout=REQUEST_TIMEOUT,
+            )
+        except requests.RequestException as e:
+            raise JiraError(str(e)) from e
+
+        if not response.ok:
+            raise JiraError(_error_message(response), response.status_code)
+
+        try:
+            return response.json()
+        except ValueError as e:
+            raise UnexpectedResponse(f"{path}: response is not JSON") from e
+
+    def _fallback(self, method: str, *args, **kwargs) -> Any:
+        """Call ``method`` on this thread's full jira client.
+
+        The client is created on first use. JIRAError is re-raised as
+        JiraError; converting the result is up to the caller.
+        """
+        from jira import JIRA, JIRAError
+
+        try:
+            full_client = getattr(self._local, "full_client", None)
+            if full_client is None:
+                full_client = JIRA(server=self.server, basic_auth=self.basic_auth)
+                self._local.full_client = full_client
+            return getattr(full_client, method)(*args, **kwargs)
+        except JIRAError as e:
+            raise JiraError(e.text or str(e), e.status_code) from e
+        except requests.RequestException as e:
+            raise JiraError(str(e)) from e
+
+    def myself(self) -> Resource:
+        """Return the authenticated user."""
+        try:
+            user = self._get("myself")
+            if not isinstance(user, dict):
+                raise UnexpectedResponse("myself: expected an object")
+        except UnexpectedResponse:
+            user = self._fallback("myself")
+        return _to_resource(user)
+
+    def projects(self) -> List[Resource]:
+        """Return the projects visible to the user."""
+        try:
+            projects = self._get("project")
+            if not all("key" in p and "name" in p for p in projects):
+                raise UnexpectedResponse("project: missing key or name")
+        except (UnexpectedResponse, TypeError):
+            projects = [project.raw for project in self._fallback("projects")]
+        return _to_resource(projects)
+
+    def statuses(self) -> List[Resource]:
+        """Return all statuses, one entry per workflow that uses them."""
+        try:
+            statuses = self._get("status")
+            if not all("name" in s for s in statuses):
+                raise UnexpectedResponse("status: missing name")
+        except (UnexpectedResponse, TypeError):
+            statuses = [status.raw for status in self._fallback("statuses")]
+        return _to_resource(statuses)
+
+    def search_issues(
+        self,
+        jql: str,
+        fields: str,
+        max_results: int = 50,
+        start_at: int = 0,
+        page_token: Optional[str] = None,
+    ) -> ResultList:
+        """Return one page of issues matching ``jql``.
+
+        Jira Cloud pages with ``page_token`` (the previous page's
+        nextPageToken) and ignores ``start_at``; Jira Server pages with
+        ``start_at``.
+        """
+        params = {"jql": jql, "fields": fields, "maxResults": max_results}
+        if self.is_cloud:
+            path = "search/jql"
+            if page_token:
+                params["nextPageToken"] = page_token
+        else:
+            path = "search"
+            params["startAt"] = start_at
+
+        try:
+            data = self._get(path, **params)
+            issues = [_issue(raw) for raw in data["issues"]]
+        except (UnexpectedResponse, KeyError, TypeError):
+            if page_token:
+                results = self._fallback(
+                    "enhanced_search_issues",
+                    jql,
+                    nextPageToken=page_token,
+                    maxResults=max_results,
+                    fields=fields,
+                )
+            else:
+                results = self._fallback(
+                    "search_issues",
+                    jql,
+                    startAt=start_at,
+                    maxResults=max_results,
+                    fields=fields,
+                )
+            issues = [_issue(issue.raw) for issue in results]
+            return ResultList(
+                issues,
+                getattr(results, "total", len(issues)),
+                getattr(results, "nextPageToken", None),
+            )
+
+        return ResultList(
+            issues, data.get("total", len(issues)), data.get("nextPageToken")
+        )
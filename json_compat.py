@@ -0,0 +1,30 @@
+"""
+JSON helpers for Conductor's config and cache files.
+
+orjson is used when it is installed (it is an optional speed-up, not a
+dependency); otherwise the stdlib json module is used. Both sides work on
+bytes so files can be read and written in binary mode. Parse errors raise
+ValueError in both cases.
+"""
+
+try:
+    import orjson
+
+    def loads(data: bytes):
+        """Parse JSON from bytes."""
+        return orjson.loads(data)
+
+    def dumps(obj) -> bytes:
+        """Serialize to indented JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    import json
+
+    def loads(data: bytes):
+        """Parse JSON from bytes."""
+        return json.loads(data)
+
+    def dumps(obj) -> bytes:
+        """Serialize to indented JSON bytes."""
+        return json.dumps(obj, indent=2).encode()
@@ -1,7 +1,39 @@
 """
-Global settings for Conductor.
+Global settings and shared file helpers for Conductor.
 """
 
 from pathlib import Path
+from typing import Optional
 
 CONDUCTOR_HOME = Path.home() / ".conductor-devtools"
+CONFIG_PATH = CONDUCTOR_HOME / "config.json"
+ENV_PATH = CONDUCTOR_HOME / ".env"
+
+# Where install.sh puts the command wrappers
+BIN_DIR = Path.home() / ".local" / "bin"
+
+
+def read_env_value(env_path: Path, key: str) -> Optional[str]:
+    """Read a single KEY=value entry from a .env file.
+
+    Handles blank lines, comments, an optional "export " prefix and quoted
+    values, which covers what setup writes.
+    """
+    for line in env_path.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        name, _, value = line.partition("=")
+        name = name.strip()
+        if name.startswith("export "):
+            name = name[len("export ") :].strip()
+        if name != key:
+            continue
+
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        return value
+
+    return None
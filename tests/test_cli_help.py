@@ -0,0 +1,23 @@
+"""The --help fast path must print exactly what argparse would."""
+
+import pytest
+
+import cli_help
+import conductor
+
+
+def test_fast_path_help_matches_parser(monkeypatch):
+    # argparse wraps to the terminal width; the fast path assumes a normal one
+    monkeypatch.setenv("COLUMNS", "80")
+
+    assert cli_help.HELP == conductor.build_parser().format_help()
+
+
+def test_fast_path_prints_help_once(monkeypatch, capsys):
+    monkeypatch.setenv("COLUMNS", "80")
+    monkeypatch.setattr("sys.argv", ["conductor", "--help"])
+
+    with pytest.raises(SystemExit):
+        conductor.main()
+
+    assert capsys.readouterr().out == conductor.build_parser().format_help()
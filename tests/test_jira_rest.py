@@ -0,0 +1,153 @@
+"""Tests for the minimal Jira REST client, with requests mocked out."""
+
+import threading
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from jira_rest import Issue, JiraClient, JiraError, Resource, ResultList
+
+FIELDS = "summary,status,issuetype"
+
+
+def make_response(status_code=200, payload=None, reason="OK"):
+    """A stand-in for requests.Response with just what the client reads."""
+    response = mock.Mock()
+    response.status_code = status_code
+    response.ok = status_code < 400
+    response.reason = reason
+    response.json.return_value = payload
+    return response
+
+
+def raw_issue(key, summary="Fix login"):
+    return {
+        "key": key,
+        "fields": {
+            "summary": summary,
+            "status": {"name": "To Do"},
+            "issuetype": {"name": "Bug"},
+        },
+    }
+
+
+@pytest.fixture
+def session_get():
+    with mock.patch("requests.Session.get") as get:
+        yield get
+
+
+def test_cloud_search_pages_with_next_page_token(session_get):
+    session_get.side_effect = [
+        make_response(
+            payload={"issues": [raw_issue("ABC-1")], "nextPageToken": "tok-2"}
+        ),
+        make_response(payload={"issues": [raw_issue("ABC-2")], "isLast": True}),
+    ]
+    jira = JiraClient("https://example.atlassian.net/", basic_auth=("u", "t"))
+    assert jira.is_cloud
+
+    first = jira.search_issues("project = ABC", FIELDS, max_results=1)
+    second = jira.search_issues(
+        "project = ABC", FIELDS, max_results=1, page_token=first.nextPageToken
+    )
+
+    assert [issue.key for issue in first] == ["ABC-1"]
+    assert first.nextPageToken == "tok-2"
+    assert [issue.key for issue in second] == ["ABC-2"]
+    assert second.nextPageToken is None
+    assert second[0].fields.summary == "Fix login"
+    assert second[0].fields.status.name == "To Do"
+
+    first_call, second_call = session_get.call_args_list
+    assert first_call.args[0] == "https://example.atlassian.net/rest/api/2/search/jql"
+    assert "nextPageToken" not in first_call.kwargs["params"]
+    assert "startAt" not in first_call.kwargs["params"]
+    assert second_call.kwargs["params"]["nextPageToken"] == "tok-2"
+
+
+def test_server_search_pages_with_start_at(session_get):
+    session_get.side_effect = [
+        make_response(
+            payload={"issues": [raw_issue("ABC-1")], "startAt": 0, "total": 2}
+        ),
+        make_response(
+            payload={"issues": [raw_issue("ABC-2")], "startAt": 1, "total": 2}
+        ),
+    ]
+    jira = JiraClient("https://jira.example.com", basic_auth=("u", "t"))
+    assert not jira.is_cloud
+
+    first = jira.search_issues("project = ABC", FIELDS, max_results=1)
+    second = jira.search_issues("project = ABC", FIELDS, max_results=1, start_at=1)
+
+    assert isinstance(first, ResultList)
+    assert [issue.key for issue in first + second] == ["ABC-1", "ABC-2"]
+    assert first.total == 2
+    assert first.nextPageToken is None
+
+    first_call, second_call = session_get.call_args_list
+    assert first_call.args[0] == "https://jira.example.com/rest/api/2/search"
+    assert first_call.kwargs["params"]["startAt"] == 0
+    assert second_call.kwargs["params"]["startAt"] == 1
+
+
+def test_unauthorized_raises_jira_error(session_get):
+    session_get.return_value = make_response(
+        status_code=401, payload={"errorMessages": ["Bad credentials"]}
+    )
+    jira = JiraClient("https://jira.example.com", basic_auth=("u", "t"))
+
+    with pytest.raises(JiraError) as excinfo:
+        jira.search_issues("project = ABC", FIELDS)
+
+    assert excinfo.value.status_code == 401
+    assert "Bad credentials" in str(excinfo.value)
+
+
+def test_fallback_results_use_this_modules_types(session_get):
+    session_get.return_value = make_response(payload={"unexpected": True})
+    jira_issues = mock.Mock()
+    jira_issues.__iter__ = lambda self: iter([SimpleNamespace(raw=raw_issue("A-1"))])
+    jira_issues.total = 7
+    jira_issues.nextPageToken = None
+    full_client = mock.Mock()
+    full_client.search_issues.return_value = jira_issues
+
+    jira = JiraClient("https://jira.example.com", basic_auth=("u", "t"))
+    with mock.patch("jira.JIRA", return_value=full_client):
+        results = jira.search_issues("project = ABC", FIELDS)
+
+    assert isinstance(results, ResultList)
+    assert results.total == 7
+    assert isinstance(results[0], Issue)
+    assert isinstance(results[0].fields.status, Resource)
+    assert results[0].fields.summary == "Fix login"
+
+
+def test_fallback_errors_become_jira_error(session_get):
+    from jira import JIRAError
+
+    session_get.return_value = make_response(payload=None)
+    full_client = mock.Mock()
+    full_client.myself.side_effect = JIRAError("Unauthorized", status_code=401)
+
+    jira = JiraClient("https://jira.example.com", basic_auth=("u", "t"))
+    with mock.patch("jira.JIRA", return_value=full_client):
+        with pytest.raises(JiraError) as excinfo:
+            jira.myself()
+
+    assert excinfo.value.status_code == 401
+
+
+def test_each_thread_gets_its_own_session():
+    jira = JiraClient("https://jira.example.com", basic_auth=("u", "t"))
+    sessions = []
+    worker = threading.Thread(target=lambda: sessions.append(jira.session))
+    worker.start()
+    worker.join()
+
+    assert jira.session is jira.session
+    assert sessions[0] is not jira.session
+    assert sessions[0].auth == jira.session.auth == ("u", "t")
@@ -3,13 +3,16 @@
 Version checking and update utilities for Conductor.
 """
 
-import json
+import functools
 import os
-from datetime import datetime, timedelta
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime
 from pathlib import Path
 from typing import Optional, Tuple
 
-import requests
+import json_compat
 
 # Current version - this should match pyproject.toml
 __version__ = "1.0.8"
@@ -27,21 +30,63 @@ def get_current_version() -> str:
     return __version__
 
 
-def get_latest_version() -> Optional[str]:
-    """Fetch the latest version from GitHub releases."""
+def load_version_cache() -> dict:
+    """Load the version check cache, or an empty dict if unavailable."""
+    try:
+        with open(VERSION_CACHE_FILE, "rb") as f:
+            return json_compat.loads(f.read())
+    except Exception:
+        return {}
+
+
+def fetch_latest_release(cache: dict) -> Optional[str]:
+    """Fetch the latest version from GitHub releases.
+
+    Sends the ETag/Last-Modified stored in ``cache`` so an unchanged release
+    comes back as an empty 304 and the cached tag is reused. A full response
+    records its validators and tag in ``cache``; saving it is up to the
+    caller (see save_version_check).
+    """
+    headers = {}
+    if cache.get("cached_tag"):
+        if cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+        if cache.get("last_modified"):
+            headers["If-Modified-Since"] = cache["last_modified"]
+
     try:
-        response = requests.get(VERSION_CHECK_URL, timeout=5)
+        # Imported here so that reading __version__ stays cheap
+        import requests
+
+        response = requests.get(VERSION_CHECK_URL, headers=headers, timeout=5)
+        if response.status_code == 304:
+            return cache["cached_tag"].lstrip("v")
         if response.status_code == 200:
             data = response.json()
+            tag = data.get("tag_name", "")
+            cache.update(
+                {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "cached_tag": tag,
+                }
+            )
             # Remove 'v' prefix if present
-            version = data.get("tag_name", "").lstrip("v")
-            return version
+            return tag.lstrip("v")
     except Exception:
         # Silently fail if we can't check for updates
         pass
     return None
 
 
+def get_latest_version() -> Optional[str]:
+    """Fetch the latest version from GitHub releases and update the cache."""
+    cache = load_version_cache()
+    latest = fetch_latest_release(cache)
+    save_version_check(cache)
+    return latest
+
+
 def parse_version(version: str) -> Tuple[int, ...]:
     """Parse version string into tuple of integers for comparison."""
     try:
@@ -56,30 +101,41 @@ def is_newer_version(current: str, latest: str) -> bool:
 
 
 def should_check_for_updates() -> bool:
-    """Determine if enough time has passed to check for updates."""
-    if not VERSION_CACHE_FILE.exists():
-        return True
+    """Determine if enough time has passed to check for updates.
 
+    Uses the cache file's mtime (refreshed by every save_version_check), so
+    the common "checked recently" path is a single stat with no JSON parse.
+    """
     try:
-        with open(VERSION_CACHE_FILE, "r") as f:
-            cache = json.load(f)
-
-        last_check = datetime.fromisoformat(cache.get("last_check", "2000-01-01"))
-        return datetime.now() - last_check > timedelta(days=CHECK_INTERVAL_DAYS)
-    except Exception:
+        last_check = os.stat(VERSION_CACHE_FILE).st_mtime
+    except OSError:
         return True
+    return time.time() - last_check > CHECK_INTERVAL_DAYS * 86400
 
 
-def save_version_check() -> None:
-    """Save the timestamp of the last version check."""
+def save_version_check(cache: Optional[dict] = None) -> None:
+    """Save the timestamp of the last version check.
+
+    ``cache`` is the already-loaded cache (with any new validators from
+    fetch_latest_release) so a check reads and writes the file only once.
+    """
     try:
         INSTALL_DIR.mkdir(parents=True, exist_ok=True)
-        cache = {
-            "last_check": datetime.now().isoformat(),
-            "current_version": get_current_version(),
-        }
-        with open(VERSION_CACHE_FILE, "w") as f:
-            json.dump(cache, f, indent=2)
+        if cache is None:
+            cache = load_version_cache()
+        cache.update(
+            {
+                "last_check": datetime.now().isoformat(),
+                "current_version": get_current_version(),
+            }
+        )
+        # Write a temp file and swap it in, so a check cut off mid-write
+        # (it runs on a daemon thread) can't leave a truncated cache behind
+        # with a fresh mtime
+        tmp_file = VERSION_CACHE_FILE.with_name(f".version_cache.{os.getpid()}")
+        with open(tmp_file, "wb") as f:
+            f.write(json_compat.dumps(cache))
+        os.replace(tmp_file, VERSION_CACHE_FILE)
     except Exception:
         pass
 
@@ -98,10 +154,11 @@ def check_for_updates(silent: bool = False) -> Optional[str]:
         return None
 
     current = get_current_version()
-    latest = get_latest_version()
+    cache = load_version_cache()
+    latest = fetch_latest_release(cache)
 
-    # Save check timestamp
-    save_version_check()
+    # Save check timestamp (and any new validators) in one write
+    save_version_check(cache)
 
     if latest and is_newer_version(current, latest):
         return latest
@@ -109,6 +166,24 @@ def check_for_updates(silent: bool = False) -> Optional[str]:
     return None
 
 
+def start_update_check() -> "Future[Optional[str]]":
+    """Run check_for_updates on a daemon thread and return its future.
+
+    The network round-trip overlaps with whatever the caller does next, and
+    a slow check can never hold up interpreter exit.
+    """
+    future: "Future[Optional[str]]" = Future()
+
+    def run() -> None:
+        try:
+            future.set_result(check_for_updates())
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="conductor-update-check", daemon=True).start()
+    return future
+
+
 def print_update_message(latest_version: str) -> None:
     """Print a friendly update notification."""
     current = get_current_version()
@@ -127,20 +202,17 @@ def print_update_message(latest_version: str) -> None:
     print("=" * 60 + "\n")
 
 
+@functools.lru_cache(maxsize=1)
 def get_install_method() -> str:
     """Detect how Conductor was installed."""
     # Check if running from a uv-managed environment
     if os.getenv("VIRTUAL_ENV") or os.getenv("UV_PROJECT_ENVIRONMENT"):
         return "uv"
 
-    # Check if installed via pip (site-packages)
-    try:
-        import conductor
-
-        if "site-packages" in conductor.__file__:
-            return "pip"
-    except (ImportError, AttributeError):
-        pass
+    # Check if installed via pip (site-packages). This module ships next to
+    # conductor.py, so its own location answers that without importing it.
+    if "site-packages" in Path(__file__).resolve().parts:
+        return "pip"
 
     # Default to script installation
     return "script"